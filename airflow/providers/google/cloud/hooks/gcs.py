@@ -175,6 +175,18 @@ class GCSHook(GoogleBaseHook):
 
         return self._conn
 
+    def get_bucket(self, bucket_name: str, user_project: str | None = None) -> storage.Bucket:
+        """
+        Return a local handle to a Google Cloud Storage bucket.
+
+        No API request is made, so this does not check that the bucket exists.
+
+        :param bucket_name: name of the bucket
+        :param user_project: The identifier of the Google Cloud project to bill for the request.
+            Required for Requester Pays buckets.
+        """
+        return self.get_conn().bucket(bucket_name, user_project=user_project)
+
     def copy(
         self,
         source_bucket: str,
@@ -20,8 +20,14 @@
 from __future__ import annotations
 
 import os
+import queue
+import stat
+import threading
+import zlib
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from contextlib import contextmanager
 from tempfile import NamedTemporaryFile
-from typing import TYPE_CHECKING, Sequence
+from typing import TYPE_CHECKING, Generator, Iterable, Iterator, Sequence
 
 from airflow.exceptions import AirflowException
 from airflow.models import BaseOperator
@@ -29,10 +35,195 @@ from airflow.providers.google.cloud.hooks.gcs import GCSHook
 from airflow.providers.sftp.hooks.sftp import SFTPHook
 
 if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    import paramiko
+    from google.cloud.storage import Blob, Bucket
+
+    from airflow.typing_compat import Self
     from airflow.utils.context import Context
 
 
 WILDCARD = "*"
+# Size of the reads issued against the remote file when streaming it to GCS.
+COPY_BUFFER_SIZE = 1024 * 1024
+# Maximum number of chunks read ahead of the GCS upload when streaming.
+STREAM_QUEUE_SIZE = 8
+# GCS resumable upload chunks must be a multiple of this size.
+GCS_CHUNK_SIZE_MULTIPLE = 256 * 1024
+# Default size of the chunks sent to GCS when streaming, as for google-cloud-storage's BlobWriter.
+DEFAULT_GCS_CHUNK_SIZE = 40 * 1024 * 1024
+# Largest upload google-cloud-storage sends as a single (multipart) request.
+MAX_SINGLE_REQUEST_SIZE = 8 * 1024 * 1024
+# Checksums google-cloud-storage can verify uploads with.
+CHECKSUM_TYPES = ("crc32c", "md5", None)
+
+
+def _iter_matching_files(
+    sftp_client: paramiko.SFTPClient, path: str, prefix: str, delimiter: str
+) -> Iterator[str]:
+    """
+    Recursively yield the regular files under ``path`` starting with ``prefix`` and ending with ``delimiter``.
+
+    This walks the tree depth first like :meth:`SFTPHook.get_tree_map`, but yields matches as soon as
+    each directory is listed instead of building the full list first, and reuses the attributes
+    returned by the directory listing instead of issuing a ``stat`` per entry.
+    """
+    for entry in sorted(sftp_client.listdir_attr(path), key=lambda entry: entry.filename):
+        pathname = os.path.join(path, entry.filename)
+        mode = entry.st_mode
+        if mode is None or stat.S_ISLNK(mode):
+            # Follow symbolic links, as get_tree_map does.
+            mode = sftp_client.stat(pathname).st_mode or 0
+        if stat.S_ISDIR(mode):
+            yield from _iter_matching_files(sftp_client, pathname, prefix, delimiter)
+        elif stat.S_ISREG(mode) and pathname.startswith(prefix) and pathname.endswith(delimiter):
+            yield pathname
+
+
+class _SFTPHookPool:
+    """
+    Pool of SFTP hooks, so that every concurrent transfer uses a dedicated SFTP connection.
+
+    Hooks are created lazily, up to ``size`` of them. A hook whose transfer raised an error
+    has its connection closed before it is returned to the pool, so the next user reconnects.
+    """
+
+    def __init__(self, sftp_conn_id: str, size: int) -> None:
+        self.sftp_conn_id = sftp_conn_id
+        self.size = size
+        self._idle_hooks: queue.SimpleQueue[SFTPHook] = queue.SimpleQueue()
+        self._hooks: list[SFTPHook] = []
+        self._reserved = 0
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def acquire(self) -> Generator[SFTPHook, None, None]:
+        sftp_hook = self._get()
+        try:
+            yield sftp_hook
+        except BaseException:
+            # Also on AirflowTaskTimeout, which may have interrupted the hook mid-transfer.
+            sftp_hook.close_conn()
+            raise
+        finally:
+            self._idle_hooks.put(sftp_hook)
+
+    def close(self) -> None:
+        for sftp_hook in self._hooks:
+            sftp_hook.close_conn()
+
+    def _get(self) -> SFTPHook:
+        while True:
+            try:
+                return self._idle_hooks.get_nowait()
+            except queue.Empty:
+                pass
+            with self._lock:
+                reserved = self._reserved < self.size
+                if reserved:
+                    self._reserved += 1
+            if reserved:
+                return self._create()
+            try:
+                # Wake up periodically, in case a reserved hook failed to be created.
+                return self._idle_hooks.get(timeout=1)
+            except queue.Empty:
+                pass
+
+    def _create(self) -> SFTPHook:
+        # Built outside the lock: looking up the connection may query the metadata DB or a secrets backend.
+        try:
+            sftp_hook = SFTPHook(self.sftp_conn_id)
+        except BaseException:
+            with self._lock:
+                self._reserved -= 1
+            raise
+        with self._lock:
+            self._hooks.append(sftp_hook)
+        return sftp_hook
+
+
+class _ThreadedChunkReader:
+    """
+    Read-only file-like object over chunks produced by a background thread.
+
+    The thread pulls ``chunks`` into a bounded queue, so producing them overlaps with consuming
+    them through :meth:`read`. An error raised while producing the chunks is re-raised by
+    :meth:`read`, which also raises once ``cancelled`` is set. When the ``with`` block exits with
+    an error, the thread is stopped but not waited for, as it may be blocked on a stalled connection.
+    """
+
+    def __init__(self, chunks: Iterator[bytes], cancelled: threading.Event | None = None) -> None:
+        self._chunks = chunks
+        self._cancelled = cancelled or threading.Event()
+        self._queue: queue.Queue[bytes | BaseException | None] = queue.Queue(maxsize=STREAM_QUEUE_SIZE)
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._produce, name="sftp-to-gcs-reader", daemon=True)
+        self._pending = bytearray()
+        self._position = 0
+        self._eof = False
+
+    def __enter__(self) -> Self:
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self._stopped.set()
+        if exc_type is None:
+            self._thread.join()
+
+    def read(self, size: int = -1) -> bytes:
+        # Fill the request completely unless the end is reached: a short read ends a resumable upload.
+        while not self._eof and (size < 0 or len(self._pending) < size):
+            chunk = self._get()
+            if chunk is None:
+                self._eof = True
+            else:
+                self._pending += chunk
+        if size < 0 or size >= len(self._pending):
+            data = bytes(self._pending)
+            self._pending.clear()
+        else:
+            data = bytes(self._pending[:size])
+            del self._pending[:size]
+        self._position += len(data)
+        return data
+
+    def tell(self) -> int:
+        return self._position
+
+    def _get(self) -> bytes | None:
+        while True:
+            if self._cancelled.is_set():
+                raise AirflowException("The transfer was cancelled because another transfer failed")
+            try:
+                item = self._queue.get(timeout=1)
+            except queue.Empty:
+                continue
+            if isinstance(item, BaseException):
+                raise item
+            return item
+
+    def _produce(self) -> None:
+        try:
+            for chunk in self._chunks:
+                if not self._put(chunk):
+                    return
+        except BaseException as e:
+            self._put(e)
+        else:
+            self._put(None)
+
+    def _put(self, item: bytes | BaseException | None) -> bool:
+        # Give up once the consumer has stopped, instead of blocking forever on a full queue.
+        while not (self._stopped.is_set() or self._cancelled.is_set()):
+            try:
+                self._queue.put(item, timeout=1)
+                return True
+            except queue.Full:
+                pass
+        return False
 
 
 class SFTPToGCSOperator(BaseOperator):
@@ -71,6 +262,29 @@ class SFTPToGCSOperator(BaseOperator):
         Service Account Token Creator IAM role to the directly preceding identity, with first
         account from the list granting this role to the originating account (templated).
     :param sftp_prefetch: Whether to enable SFTP prefetch, the default is True.
+    :param concurrency: Maximum number of files transferred in parallel when a wildcard
+        is used in ``source_path``. Every parallel transfer uses a dedicated SFTP connection
+        from a pool of this size, as paramiko channels are not thread-safe.
+        The default is 1 (sequential transfer).
+    :param use_stream: Whether to stream the file from SFTP directly into the destination
+        object instead of staging it in a local temporary file first. This avoids writing
+        every file to local disk and reading it back. The default is True.
+    :param gcs_chunk_size: Size in bytes of the chunks sent to GCS when ``use_stream`` is True.
+        It must be a multiple of 256 KiB. Larger chunks mean fewer upload requests per file,
+        at the cost of buffering one chunk in memory per concurrent transfer. Defaults to 40 MiB.
+    :param resumable_threshold: Files smaller than this many bytes are uploaded in a single
+        request instead of through a resumable upload session, when ``use_stream`` is True and
+        ``gzip`` is False. Defaults to 8 MiB, the largest size ``google-cloud-storage`` sends as a
+        single multipart request, which is also the maximum value.
+    :param sftp_block_size: Size in bytes of each read request sent to the SFTP server when
+        ``use_stream`` is True. Larger requests keep more data in flight during prefetch, which
+        helps on high-latency links, but servers may cap the size they answer per request
+        (around 256 KiB for OpenSSH). Defaults to paramiko's default (32 KiB).
+    :param checksum: Checksum computed while streaming each file and verified against the one
+        GCS reports for the uploaded object, when ``use_stream`` is True. Either ``"crc32c"``
+        (recommended, it requires the ``google-crc32c`` C extension to be fast), ``"md5"``,
+        or None to skip verification. The default is None. Setting it with ``use_stream=False``
+        raises a ``ValueError``.
     """
 
     template_fields: Sequence[str] = (
@@ -93,10 +307,33 @@ class SFTPToGCSOperator(BaseOperator):
         move_object: bool = False,
         impersonation_chain: str | Sequence[str] | None = None,
         sftp_prefetch: bool = True,
+        concurrency: int = 1,
+        use_stream: bool = True,
+        gcs_chunk_size: int | None = None,
+        resumable_threshold: int = MAX_SINGLE_REQUEST_SIZE,
+        sftp_block_size: int | None = None,
+        checksum: str | None = None,
         **kwargs,
     ) -> None:
         super().__init__(**kwargs)
 
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be a positive integer, got {concurrency}")
+        if gcs_chunk_size is not None and (gcs_chunk_size <= 0 or gcs_chunk_size % GCS_CHUNK_SIZE_MULTIPLE):
+            raise ValueError(
+                f"gcs_chunk_size must be a positive multiple of 256 KiB ({GCS_CHUNK_SIZE_MULTIPLE}), "
+                f"got {gcs_chunk_size}"
+            )
+        if resumable_threshold > MAX_SINGLE_REQUEST_SIZE:
+            raise ValueError(
+                f"resumable_threshold must be at most 8 MiB ({MAX_SINGLE_REQUEST_SIZE}), "
+                f"got {resumable_threshold}"
+            )
+        if checksum not in CHECKSUM_TYPES:
+            raise ValueError(f"checksum must be one of 'crc32c', 'md5' or None, got {checksum!r}")
+        if checksum and not use_stream:
+            raise ValueError("checksum is only supported when use_stream is True")
+
         self.source_path = source_path
         self.destination_path = destination_path
         self.destination_bucket = destination_bucket
@@ -107,6 +344,12 @@ class SFTPToGCSOperator(BaseOperator):
         self.move_object = move_object
         self.impersonation_chain = impersonation_chain
         self.sftp_prefetch = sftp_prefetch
+        self.concurrency = concurrency
+        self.use_stream = use_stream
+        self.gcs_chunk_size = gcs_chunk_size
+        self.resumable_threshold = resumable_threshold
+        self.sftp_block_size = sftp_block_size
+        self.checksum = checksum
 
     def execute(self, context: Context):
         self.destination_path = self._set_destination_path(self.destination_path)
@@ -115,31 +358,106 @@ class SFTPToGCSOperator(BaseOperator):
             gcp_conn_id=self.gcp_conn_id,
             impersonation_chain=self.impersonation_chain,
         )
+        if self.use_stream and self.checksum == "crc32c":
+            self._warn_if_slow_crc32c()
+        # Resolve the bucket once rather than once per transferred file.
+        dest_bucket = gcs_hook.get_bucket(self.destination_bucket) if self.use_stream else None
 
         sftp_hook = SFTPHook(self.sftp_conn_id)
+        try:
+            wildcard_index = self.source_path.find(WILDCARD)
+            if wildcard_index >= 0:
+                if self.source_path.find(WILDCARD, wildcard_index + 1) >= 0:
+                    raise AirflowException(
+                        "Only one wildcard '*' is allowed in source_path parameter. "
+                        f"Found {self.source_path.count(WILDCARD)} in {self.source_path}."
+                    )
+
+                prefix = self.source_path[:wildcard_index]
+                delimiter = self.source_path[wildcard_index + 1 :]
+                base_path = os.path.dirname(prefix)
 
-        if WILDCARD in self.source_path:
-            total_wildcards = self.source_path.count(WILDCARD)
-            if total_wildcards > 1:
-                raise AirflowException(
-                    "Only one wildcard '*' is allowed in source_path parameter. "
-                    f"Found {total_wildcards} in {self.source_path}."
+                files = _iter_matching_files(sftp_hook.get_conn(), base_path, prefix, delimiter)
+                self._copy_multiple_objects(gcs_hook, sftp_hook, files, base_path, dest_bucket)
+
+            else:
+                destination_object = (
+                    self.destination_path if self.destination_path else self.source_path.rsplit("/", 1)[1]
+                )
+                self._copy_single_object(
+                    gcs_hook, sftp_hook, self.source_path, destination_object, dest_bucket=dest_bucket
                 )
+        finally:
+            sftp_hook.close_conn()
 
-            prefix, delimiter = self.source_path.split(WILDCARD, 1)
-            base_path = os.path.dirname(prefix)
+    def _copy_multiple_objects(
+        self,
+        gcs_hook: GCSHook,
+        sftp_hook: SFTPHook,
+        files: Iterable[str],
+        base_path: str,
+        dest_bucket: Bucket | None = None,
+    ) -> None:
+        """
+        Copy objects as soon as they are listed.
 
-            files, _, _ = sftp_hook.get_tree_map(base_path, prefix=prefix, delimiter=delimiter)
+        Sequential transfers reuse ``sftp_hook``, the connection used for listing. Parallel transfers
+        take a connection from a pool of ``concurrency`` hooks per worker, so listing and copying overlap.
 
+        Once a parallel transfer fails, or the task is interrupted, listing stops, files not started yet
+        are skipped, and streamed transfers still in flight are aborted. None of the remaining
+        transfers deletes its source file when ``move_object`` is True.
+        """
+        # Every listed file starts with base_path, so swapping it for the destination
+        # prefix is a plain slice rather than a str.replace scan per file.
+        base_path_len = len(base_path)
+        destination_prefix = self.destination_path
+
+        if self.concurrency == 1:
             for file in files:
-                destination_path = file.replace(base_path, self.destination_path, 1)
-                self._copy_single_object(gcs_hook, sftp_hook, file, destination_path)
+                destination_path = destination_prefix + file[base_path_len:]
+                self._copy_single_object(gcs_hook, sftp_hook, file, destination_path, dest_bucket=dest_bucket)
+            return
 
-        else:
-            destination_object = (
-                self.destination_path if self.destination_path else self.source_path.rsplit("/", 1)[1]
-            )
-            self._copy_single_object(gcs_hook, sftp_hook, self.source_path, destination_object)
+        # Connections for parallel transfers; sftp_hook keeps listing meanwhile.
+        sftp_hook_pool = _SFTPHookPool(self.sftp_conn_id, size=self.concurrency)
+        cancelled = threading.Event()
+
+        def copy_file(file: str) -> None:
+            if cancelled.is_set():
+                return
+            destination_path = destination_prefix + file[base_path_len:]
+            with sftp_hook_pool.acquire() as worker_sftp_hook:
+                self._copy_single_object(
+                    gcs_hook,
+                    worker_sftp_hook,
+                    file,
+                    destination_path,
+                    dest_bucket=dest_bucket,
+                    cancelled=cancelled,
+                )
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+                pending: set[Future[None]] = set()
+                try:
+                    for file in files:
+                        # Keep at most `concurrency` transfers in flight, so that listing stops and
+                        # the error is raised as soon as one of them fails.
+                        if len(pending) >= self.concurrency:
+                            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                            for future in done:
+                                future.result()
+                        pending.add(executor.submit(copy_file, file))
+                    for future in as_completed(pending):
+                        future.result()
+                except BaseException:
+                    # Let the transfers in flight stop early, as leaving the executor waits for them.
+                    cancelled.set()
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    raise
+        finally:
+            sftp_hook_pool.close()
 
     def _copy_single_object(
         self,
@@ -147,6 +465,8 @@ class SFTPToGCSOperator(BaseOperator):
         sftp_hook: SFTPHook,
         source_path: str,
         destination_object: str,
+        dest_bucket: Bucket | None = None,
+        cancelled: threading.Event | None = None,
     ) -> None:
         """Copy single object."""
         self.log.info(
@@ -156,21 +476,93 @@ class SFTPToGCSOperator(BaseOperator):
             destination_object,
         )
 
-        with NamedTemporaryFile("w") as tmp:
-            sftp_hook.retrieve_file(source_path, tmp.name, prefetch=self.sftp_prefetch)
-
-            gcs_hook.upload(
-                bucket_name=self.destination_bucket,
-                object_name=destination_object,
-                filename=tmp.name,
-                mime_type=self.mime_type,
-                gzip=self.gzip,
+        if self.use_stream:
+            if dest_bucket is None:
+                dest_bucket = gcs_hook.get_bucket(self.destination_bucket)
+            dest_blob = dest_bucket.blob(
+                destination_object, chunk_size=self.gcs_chunk_size or DEFAULT_GCS_CHUNK_SIZE
+            )
+            with sftp_hook.get_conn().open(source_path, "rb", bufsize=COPY_BUFFER_SIZE) as remote_file:
+                file_size = remote_file.stat().st_size
+                if self.sftp_block_size:
+                    remote_file.MAX_REQUEST_SIZE = self.sftp_block_size
+                if self.sftp_prefetch:
+                    remote_file.prefetch(file_size)
+                if not self.gzip and file_size is not None and file_size < self.resumable_threshold:
+                    # Small files go in a single request, skipping the resumable session handshake.
+                    dest_blob.upload_from_file(
+                        remote_file, size=file_size, content_type=self.mime_type, checksum=self.checksum
+                    )
+                else:
+                    self._stream_object(remote_file, dest_blob, cancelled)
+            # GCSHook.upload logs the same once done, for the temporary file path below.
+            self.log.info(
+                "File %s uploaded to %s in %s bucket",
+                source_path,
+                destination_object,
+                self.destination_bucket,
             )
+        else:
+            with NamedTemporaryFile("wb") as tmp:
+                sftp_hook.retrieve_file(source_path, tmp.name, prefetch=self.sftp_prefetch)
+
+                gcs_hook.upload(
+                    bucket_name=self.destination_bucket,
+                    object_name=destination_object,
+                    filename=tmp.name,
+                    mime_type=self.mime_type,
+                    gzip=self.gzip,
+                )
 
         if self.move_object:
+            if cancelled is not None and cancelled.is_set():
+                self.log.warning("Another transfer failed, not deleting %s", source_path)
+                return
             self.log.info("Executing delete of %s", source_path)
             sftp_hook.delete_file(source_path)
 
+    def _stream_object(
+        self, remote_file: paramiko.SFTPFile, dest_blob: Blob, cancelled: threading.Event | None = None
+    ) -> None:
+        """
+        Upload the remote file to ``dest_blob`` in a resumable upload, gzip-compressing it if requested.
+
+        The remote file is read (and compressed) by a background thread, so the download and the
+        upload overlap. Memory use is bounded by ``STREAM_QUEUE_SIZE`` chunks of ``COPY_BUFFER_SIZE``
+        bytes queued by that thread, plus the ``gcs_chunk_size`` chunk being uploaded.
+
+        No size is given to the upload, so it is only finalized once ``read`` returns a short chunk,
+        that is once the whole file has been read. An error on either side aborts it without
+        creating the object, as does setting ``cancelled``.
+        """
+        with _ThreadedChunkReader(self._read_chunks(remote_file), cancelled) as stream:
+            dest_blob.upload_from_file(stream, content_type=self.mime_type, checksum=self.checksum)
+
+    def _read_chunks(self, remote_file: paramiko.SFTPFile) -> Iterator[bytes]:
+        """Read the remote file in large chunks, gzip-compressing them if requested."""
+        if not self.gzip:
+            while chunk := remote_file.read(COPY_BUFFER_SIZE):
+                yield chunk
+            return
+
+        # Same compression level as GCSHook.upload (gzip module default); wbits=31 emits a gzip container.
+        compressor = zlib.compressobj(zlib.Z_BEST_COMPRESSION, zlib.DEFLATED, 31)
+        while chunk := remote_file.read(COPY_BUFFER_SIZE):
+            yield compressor.compress(chunk)
+        yield compressor.flush()
+
+    def _warn_if_slow_crc32c(self) -> None:
+        try:
+            import google_crc32c
+        except ImportError:
+            return
+        if google_crc32c.implementation != "c":
+            self.log.warning(
+                "The google-crc32c C extension is not available, CRC32C checksums will be computed "
+                "in pure Python, which is slow for large files. Reinstall google-crc32c with the "
+                "C extension to speed up the transfer."
+            )
+
     @staticmethod
     def _set_destination_path(path: str | None) -> str:
         if path is not None:
@@ -16,7 +16,6 @@
 # under the License.
 from __future__ import annotations
 
-import textwrap
 from typing import Any
 
 import jmespath
@@ -28,7 +27,7 @@ from tests.charts.helm_template_generator import prepare_k8s_lookup_dict, render
 RELEASE_NAME = "test-extra-env-env-from"
 
 # Test Params: k8s object key and paths with expected env / envFrom
-PARAMS = [
+PARAMS = (
     (
         ("Job", f"{RELEASE_NAME}-create-user"),
         ("spec.template.spec.containers[0]",),
@@ -69,7 +68,57 @@ PARAMS = [
         ("Deployment", f"{RELEASE_NAME}-flower"),
         ("spec.template.spec.containers[0]",),
     ),
-]
+)
+
+VALUES = yaml.safe_load(
+    """
+airflowVersion: "2.6.0"
+flower:
+  enabled: true
+extraEnvFrom: |
+  - secretRef:
+      name: '{{ .Release.Name }}-airflow-connections'
+  - configMapRef:
+      name: '{{ .Release.Name }}-airflow-variables'
+extraEnv: |
+  - name: PLATFORM
+    value: FR
+  - name: TEST
+    valueFrom:
+      secretKeyRef:
+        name: '{{ .Release.Name }}-some-secret'
+        key: connection
+"""
+)
+
+EXPECTED_ENV = yaml.safe_load(
+    f"""
+- name: PLATFORM
+  value: FR
+- name: TEST
+  valueFrom:
+    secretKeyRef:
+      key: connection
+      name: {RELEASE_NAME}-some-secret
+"""
+)
+
+EXPECTED_ENV_FROM = yaml.safe_load(
+    f"""
+- secretRef:
+    name: {RELEASE_NAME}-airflow-connections
+- configMapRef:
+    name: {RELEASE_NAME}-airflow-variables
+"""
+)
+
+
+def assert_contains_run(items: list[Any] | None, expected: list[Any]) -> None:
+    """Assert that ``expected`` appears in ``items`` contiguously and in order."""
+    assert items is not None
+    assert expected[0] in items
+    start = items.index(expected[0])
+    assert items[start : start + len(expected)] == expected
 
 
 class TestExtraEnvEnvFrom:
@@ -77,63 +126,27 @@ class TestExtraEnvEnvFrom:
 
     k8s_objects: list[dict[str, Any]]
     k8s_objects_by_key: dict[tuple[str, str], dict[str, Any]]
+    env_exprs: dict[str, jmespath.parser.ParsedResult]
+    env_from_exprs: dict[str, jmespath.parser.ParsedResult]
 
     @classmethod
     def setup_class(cls) -> None:
-        values_str = textwrap.dedent(
-            """
-            airflowVersion: "2.6.0"
-            flower:
-              enabled: true
-            extraEnvFrom: |
-              - secretRef:
-                  name: '{{ .Release.Name }}-airflow-connections'
-              - configMapRef:
-                  name: '{{ .Release.Name }}-airflow-variables'
-            extraEnv: |
-              - name: PLATFORM
-                value: FR
-              - name: TEST
-                valueFrom:
-                  secretKeyRef:
-                    name: '{{ .Release.Name }}-some-secret'
-                    key: connection
-            """
-        )
-        values = yaml.safe_load(values_str)
-        cls.k8s_objects = render_chart(RELEASE_NAME, values=values)
+        cls.k8s_objects = render_chart(RELEASE_NAME, values=VALUES)
         cls.k8s_objects_by_key = prepare_k8s_lookup_dict(cls.k8s_objects)
+        paths = {path for _, env_paths in PARAMS for path in env_paths}
+        cls.env_exprs = {path: jmespath.compile(f"{path}.env") for path in paths}
+        cls.env_from_exprs = {path: jmespath.compile(f"{path}.envFrom") for path in paths}
 
     @pytest.mark.parametrize("k8s_obj_key, env_paths", PARAMS)
     def test_extra_env(self, k8s_obj_key, env_paths):
-        expected_env_as_str = textwrap.dedent(
-            f"""
-            - name: PLATFORM
-              value: FR
-            - name: TEST
-              valueFrom:
-                secretKeyRef:
-                  key: connection
-                  name: {RELEASE_NAME}-some-secret
-            """
-        ).lstrip()
         k8s_object = self.k8s_objects_by_key[k8s_obj_key]
         for path in env_paths:
-            env = jmespath.search(f"{path}.env", k8s_object)
-            assert expected_env_as_str in yaml.dump(env)
+            env = self.env_exprs[path].search(k8s_object)
+            assert_contains_run(env, EXPECTED_ENV)
 
     @pytest.mark.parametrize("k8s_obj_key, env_from_paths", PARAMS)
     def test_extra_env_from(self, k8s_obj_key, env_from_paths):
-        expected_env_from_as_str = textwrap.dedent(
-            f"""
-            - secretRef:
-                name: {RELEASE_NAME}-airflow-connections
-            - configMapRef:
-                name: {RELEASE_NAME}-airflow-variables
-            """
-        ).lstrip()
-
         k8s_object = self.k8s_objects_by_key[k8s_obj_key]
         for path in env_from_paths:
-            env_from = jmespath.search(f"{path}.envFrom", k8s_object)
-            assert expected_env_from_as_str in yaml.dump(env_from)
+            env_from = self.env_from_exprs[path].search(k8s_object)
+            assert_contains_run(env_from, EXPECTED_ENV_FROM)
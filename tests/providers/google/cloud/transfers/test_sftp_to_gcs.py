@@ -0,0 +1,365 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import gzip
+import stat
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from airflow.providers.google.cloud.transfers.sftp_to_gcs import (
+    COPY_BUFFER_SIZE,
+    MAX_SINGLE_REQUEST_SIZE,
+    SFTPToGCSOperator,
+    _iter_matching_files,
+)
+
+TASK_ID = "test-sftp-to-gcs"
+GCP_CONN_ID = "GCP_CONN_ID"
+SFTP_CONN_ID = "SFTP_CONN_ID"
+TEST_BUCKET = "test-bucket"
+SOURCE_OBJECT_NO_WILDCARD = "main_dir/test_object.bin"
+DESTINATION_PATH_FILE = "destination_dir/copy.bin"
+FILE_SIZE = 4 * COPY_BUFFER_SIZE
+SOURCE_OBJECT_WILDCARD = "main_dir/*.csv"
+# Directory listings of the SFTP tree, as (file name, st_mode) pairs per directory.
+DIR_MODE = stat.S_IFDIR | 0o755
+FILE_MODE = stat.S_IFREG | 0o644
+LINK_MODE = stat.S_IFLNK | 0o777
+SFTP_TREE = {
+    "main_dir": [("a.csv", FILE_MODE), ("b.txt", FILE_MODE), ("sub_dir", DIR_MODE), ("c.csv", FILE_MODE)],
+    "main_dir/sub_dir": [("d.csv", FILE_MODE), ("main_dir.csv", FILE_MODE)],
+}
+SFTP_TREE_FILES = [
+    "main_dir/a.csv",
+    "main_dir/c.csv",
+    "main_dir/sub_dir/d.csv",
+    "main_dir/sub_dir/main_dir.csv",
+]
+# Not aligned with COPY_BUFFER_SIZE, so that upload chunks span several reads.
+UPLOAD_CHUNK_SIZE = 3 * 256 * 1024
+
+
+def create_operator(**kwargs):
+    kwargs.setdefault("source_path", SOURCE_OBJECT_NO_WILDCARD)
+    kwargs.setdefault("destination_path", DESTINATION_PATH_FILE)
+    return SFTPToGCSOperator(
+        task_id=TASK_ID,
+        destination_bucket=TEST_BUCKET,
+        move_object=True,
+        gcp_conn_id=GCP_CONN_ID,
+        sftp_conn_id=SFTP_CONN_ID,
+        **kwargs,
+    )
+
+
+def mock_sftp_client(tree, stats=None):
+    sftp_client = mock.MagicMock()
+    sftp_client.listdir_attr.side_effect = lambda path: [
+        mock.Mock(filename=filename, st_mode=mode) for filename, mode in tree[path]
+    ]
+    sftp_client.stat.side_effect = lambda path: mock.Mock(st_mode=stats[path])
+    return sftp_client
+
+
+def mock_sftp_hooks(sftp_hook, tree):
+    """Make every SFTPHook a distinct mock listing ``tree``, and return the list of created hooks."""
+    hooks = []
+
+    def create_hook(sftp_conn_id):
+        hook = mock.MagicMock(name=f"SFTPHook-{len(hooks)}")
+        hook.get_conn.return_value = mock_sftp_client(tree)
+        hooks.append(hook)
+        return hook
+
+    sftp_hook.side_effect = create_hook
+    return hooks
+
+
+def fake_resumable_upload(uploaded):
+    """Consume the stream like a resumable upload, recording the object once it is finalized."""
+
+    def upload_from_file(stream, **kwargs):
+        assert stream.tell() == 0
+        data = bytearray()
+        while True:
+            chunk = stream.read(UPLOAD_CHUNK_SIZE)
+            data += chunk
+            if len(chunk) < UPLOAD_CHUNK_SIZE:
+                # A short read finalizes the upload.
+                uploaded.append(bytes(data))
+                return
+
+    return upload_from_file
+
+
+class TestSFTPToGCSOperator:
+    @pytest.mark.parametrize(
+        "kwargs, match",
+        [
+            pytest.param({"checksum": "crc32"}, "checksum must be one of", id="unknown-checksum"),
+            pytest.param(
+                {"checksum": "md5", "use_stream": False},
+                "checksum is only supported when use_stream is True",
+                id="checksum-without-stream",
+            ),
+        ],
+    )
+    def test_init_rejects_invalid_arguments(self, kwargs, match):
+        with pytest.raises(ValueError, match=match):
+            create_operator(**kwargs)
+
+    def test_init_rejects_non_positive_concurrency(self):
+        with pytest.raises(ValueError, match="concurrency must be a positive integer, got 0"):
+            create_operator(concurrency=0)
+
+    @pytest.mark.parametrize("destination_path", [None, "dest", "dest/", "/dest/sub/", "main_dir"])
+    @mock.patch.object(SFTPToGCSOperator, "_copy_single_object")
+    @mock.patch("airflow.providers.google.cloud.transfers.sftp_to_gcs.GCSHook")
+    @mock.patch("airflow.providers.google.cloud.transfers.sftp_to_gcs.SFTPHook")
+    def test_execute_wildcard_destination_paths(
+        self, sftp_hook, gcs_hook, copy_single_object, destination_path
+    ):
+        hooks = mock_sftp_hooks(sftp_hook, SFTP_TREE)
+
+        create_operator(source_path=SOURCE_OBJECT_WILDCARD, destination_path=destination_path).execute(None)
+
+        # Same mapping as the former file.replace(base_path, destination_path, 1).
+        normalized_destination_path = SFTPToGCSOperator._set_destination_path(destination_path)
+        assert copy_single_object.call_args_list == [
+            mock.call(
+                gcs_hook.return_value,
+                hooks[0],
+                file,
+                file.replace("main_dir", normalized_destination_path, 1),
+                dest_bucket=gcs_hook.return_value.get_bucket.return_value,
+            )
+            for file in SFTP_TREE_FILES
+        ]
+
+    @mock.patch.object(SFTPToGCSOperator, "_copy_single_object")
+    @mock.patch("airflow.providers.google.cloud.transfers.sftp_to_gcs.GCSHook")
+    @mock.patch("airflow.providers.google.cloud.transfers.sftp_to_gcs.SFTPHook")
+    def test_execute_wildcard_with_concurrency_uses_pooled_hooks(
+        self, sftp_hook, gcs_hook, copy_single_object
+    ):
+        hooks = mock_sftp_hooks(sftp_hook, SFTP_TREE)
+
+        create_operator(source_path=SOURCE_OBJECT_WILDCARD, concurrency=2).execute(None)
+
+        # The first hook lists the tree, the transfers run on at most ``concurrency`` pooled hooks.
+        copied_files = sorted(call.args[2] for call in copy_single_object.call_args_list)
+        assert copied_files == SFTP_TREE_FILES
+        transfer_hooks = {id(call.args[1]) for call in copy_single_object.call_args_list}
+        assert transfer_hooks <= {id(hook) for hook in hooks[1:]}
+        assert 2 <= len(hooks) <= 3
+        for hook in hooks:
+            hook.close_conn.assert_called_once_with()
+
+    @mock.patch("airflow.providers.google.cloud.transfers.sftp_to_gcs.GCSHook")
+    @mock.patch("airflow.providers.google.cloud.transfers.sftp_to_gcs.SFTPHook")
+    def test_execute_wildcard_with_concurrency_stops_on_first_failure(self, sftp_hook, gcs_hook):
+        files = [f"file_{i:02}.csv" for i in range(10)]
+        hooks = mock_sftp_hooks(sftp_hook, {"main_dir": [(file, FILE_MODE) for file in files]})
+        first_failed = threading.Event()
+        retrieved = []
+
+        def retrieve_file(source_path, local_path, prefetch):
+            retrieved.append(source_path)
+            if source_path == "main_dir/file_00.csv":
+                first_failed.set()
+                raise OSError("Connection lost")
+            # Still in flight when the first transfer fails.
+            first_failed.wait(timeout=5)
+            time.sleep(0.5)
+
+        for_each_hook = sftp_hook.side_effect
+
+        def create_hook(sftp_conn_id):
+            hook = for_each_hook(sftp_conn_id)
+            hook.retrieve_file.side_effect = retrieve_file
+            return hook
+
+        sftp_hook.side_effect = create_hook
+
+        with pytest.raises(OSError, match="Connection lost"):
+            create_operator(source_path=SOURCE_OBJECT_WILDCARD, use_stream=False, concurrency=2).execute(None)
+
+        # Nothing is submitted after the failure, and the transfer in flight keeps its source file.
+        assert sorted(retrieved) == ["main_dir/file_00.csv", "main_dir/file_01.csv"]
+        gcs_hook.return_value.upload.assert_called_once()
+        for hook in hooks:
+            hook.delete_file.assert_not_called()
+            hook.close_conn.assert_called_with()
+
+    @pytest.mark.parametrize("use_gzip", [False, True])
+    @mock.patch("airflow.providers.google.cloud.transfers.sftp_to_gcs.GCSHook")
+    @mock.patch("airflow.providers.google.cloud.transfers.sftp_to_gcs.SFTPHook")
+    def test_execute_without_stream_uploads_temporary_file(self, sftp_hook, gcs_hook, use_gzip):
+        create_operator(use_stream=False, gzip=use_gzip).execute(None)
+
+        retrieve_file = sftp_hook.return_value.retrieve_file
+        retrieve_file.assert_called_once_with(SOURCE_OBJECT_NO_WILDCARD, mock.ANY, prefetch=True)
+        tmp_file_name = retrieve_file.call_args.args[1]
+        gcs_hook.return_value.upload.assert_called_once_with(
+            bucket_name=TEST_BUCKET,
+            object_name=DESTINATION_PATH_FILE,
+            filename=tmp_file_name,
+            mime_type="application/octet-stream",
+            gzip=use_gzip,
+        )
+        gcs_hook.return_value.get_bucket.assert_not_called()
+        sftp_hook.return_value.delete_file.assert_called_once_with(SOURCE_OBJECT_NO_WILDCARD)
+
+
+class TestSFTPToGCSOperatorStream:
+    @staticmethod
+    def _mock_remote_file(sftp_hook, read_side_effect):
+        remote_file = sftp_hook.return_value.get_conn.return_value.open.return_value.__enter__.return_value
+        remote_file.stat.return_value.st_size = FILE_SIZE
+        remote_file.read.side_effect = read_side_effect
+        return remote_file
+
+    @staticmethod
+    def _mock_dest_blob(gcs_hook, upload_side_effect):
+        dest_blob = gcs_hook.return_value.get_bucket.return_value.blob.return_value
+        dest_blob.upload_from_file.side_effect = upload_side_effect
+        return dest_blob
+
+    @staticmethod
+    def _create_operator(**kwargs):
+        # Go through the resumable upload by default, not the single request used for small files.
+        kwargs.setdefault("resumable_threshold", COPY_BUFFER_SIZE)
+        return create_operator(**kwargs)
+
+    @pytest.mark.parametrize("use_gzip", [False, True])
+    @mock.patch("airflow.providers.google.cloud.transfers.sftp_to_gcs.GCSHook")
+    @mock.patch("airflow.providers.google.cloud.transfers.sftp_to_gcs.SFTPHook")
+    def test_execute_stream_finalizes_upload(self, sftp_hook, gcs_hook, use_gzip):
+        chunks = [bytes([i]) * COPY_BUFFER_SIZE for i in range(4)]
+        self._mock_remote_file(sftp_hook, [*chunks, b""])
+        uploaded = []
+        dest_blob = self._mock_dest_blob(gcs_hook, fake_resumable_upload(uploaded))
+
+        self._create_operator(gzip=use_gzip).execute(None)
+
+        assert len(uploaded) == 1
+        content = gzip.decompress(uploaded[0]) if use_gzip else uploaded[0]
+        assert content == b"".join(chunks)
+        dest_blob.upload_from_file.assert_called_once_with(
+            mock.ANY, content_type="application/octet-stream", checksum=None
+        )
+        sftp_hook.return_value.delete_file.assert_called_once_with(SOURCE_OBJECT_NO_WILDCARD)
+
+    @pytest.mark.parametrize("use_gzip", [False, True])
+    @mock.patch("airflow.providers.google.cloud.transfers.sftp_to_gcs.GCSHook")
+    @mock.patch("airflow.providers.google.cloud.transfers.sftp_to_gcs.SFTPHook")
+    def test_execute_stream_does_not_finalize_upload_when_sftp_read_fails(
+        self, sftp_hook, gcs_hook, use_gzip
+    ):
+        # The connection drops halfway through the file.
+        self._mock_remote_file(
+            sftp_hook,
+            [b"a" * COPY_BUFFER_SIZE, b"b" * COPY_BUFFER_SIZE, OSError("Connection lost")],
+        )
+        uploaded = []
+        self._mock_dest_blob(gcs_hook, fake_resumable_upload(uploaded))
+
+        with pytest.raises(OSError, match="Connection lost"):
+            self._create_operator(gzip=use_gzip).execute(None)
+
+        assert uploaded == []
+        sftp_hook.return_value.delete_file.assert_not_called()
+
+    @mock.patch("airflow.providers.google.cloud.transfers.sftp_to_gcs.GCSHook")
+    @mock.patch("airflow.providers.google.cloud.transfers.sftp_to_gcs.SFTPHook")
+    def test_execute_stream_fails_when_gcs_upload_fails(self, sftp_hook, gcs_hook):
+        self._mock_remote_file(sftp_hook, [b"a" * COPY_BUFFER_SIZE] * 4 + [b""])
+
+        def upload_from_file(stream, **kwargs):
+            stream.read(UPLOAD_CHUNK_SIZE)
+            raise OSError("Upload failed")
+
+        self._mock_dest_blob(gcs_hook, upload_from_file)
+
+        with pytest.raises(OSError, match="Upload failed"):
+            self._create_operator().execute(None)
+
+        sftp_hook.return_value.delete_file.assert_not_called()
+
+    @pytest.mark.parametrize("checksum", [None, "crc32c"])
+    @mock.patch("airflow.providers.google.cloud.transfers.sftp_to_gcs.GCSHook")
+    @mock.patch("airflow.providers.google.cloud.transfers.sftp_to_gcs.SFTPHook")
+    def test_execute_stream_uploads_small_file_in_single_request(self, sftp_hook, gcs_hook, checksum):
+        remote_file = self._mock_remote_file(sftp_hook, [])
+        dest_blob = gcs_hook.return_value.get_bucket.return_value.blob.return_value
+
+        self._create_operator(resumable_threshold=FILE_SIZE + 1, checksum=checksum).execute(None)
+
+        dest_blob.upload_from_file.assert_called_once_with(
+            remote_file, size=FILE_SIZE, content_type="application/octet-stream", checksum=checksum
+        )
+        dest_blob.open.assert_not_called()
+        sftp_hook.return_value.delete_file.assert_called_once_with(SOURCE_OBJECT_NO_WILDCARD)
+
+    def test_init_rejects_resumable_threshold_above_single_request_size(self):
+        with pytest.raises(ValueError, match="resumable_threshold must be at most 8 MiB"):
+            self._create_operator(resumable_threshold=MAX_SINGLE_REQUEST_SIZE + 1)
+
+
+class TestIterMatchingFiles:
+    def test_filters_by_prefix_and_delimiter(self):
+        sftp_client = mock_sftp_client(SFTP_TREE)
+
+        files = list(_iter_matching_files(sftp_client, "main_dir", "main_dir/", ".csv"))
+
+        assert files == SFTP_TREE_FILES
+        sftp_client.stat.assert_not_called()
+
+    def test_filters_by_file_name_prefix(self):
+        sftp_client = mock_sftp_client(SFTP_TREE)
+
+        files = list(_iter_matching_files(sftp_client, "main_dir", "main_dir/sub_dir/d", ""))
+
+        assert files == ["main_dir/sub_dir/d.csv"]
+
+    def test_follows_symbolic_links(self):
+        tree = {
+            "main_dir": [
+                ("file_link.csv", LINK_MODE),
+                ("dir_link", LINK_MODE),
+                ("no_mode.csv", None),
+                ("broken_link.csv", LINK_MODE),
+            ],
+            "main_dir/dir_link": [("a.csv", FILE_MODE)],
+        }
+        stats = {
+            "main_dir/file_link.csv": FILE_MODE,
+            "main_dir/dir_link": DIR_MODE,
+            "main_dir/no_mode.csv": FILE_MODE,
+            "main_dir/broken_link.csv": None,
+        }
+        sftp_client = mock_sftp_client(tree, stats)
+
+        files = list(_iter_matching_files(sftp_client, "main_dir", "main_dir/", ".csv"))
+
+        assert files == ["main_dir/dir_link/a.csv", "main_dir/file_link.csv", "main_dir/no_mode.csv"]
+        assert sorted(call.args[0] for call in sftp_client.stat.call_args_list) == sorted(stats)